@@ -13,16 +13,25 @@ Optional:
 from __future__ import annotations
 
 import math
-import re
+import mmap
+import os
 import statistics
 import sys
 import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    # NumPy is optional; without it we fall back to the stdlib statistics
+    # implementations below.
+    np = None
 
 
-NUMBER_PATTERN = re.compile(r"[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?")
 RESULTS_FILENAME = "StatisticsResults.txt"
 
 
@@ -39,47 +48,92 @@ class StatsResult: # pylint: disable=too-many-instance-attributes
     elapsed_seconds: float
 
 
-def extract_numbers_from_text(text: str) -> Tuple[List[float], int]:
+def read_input_bytes(path: Path) -> bytes:
+    """Read the whole input file as bytes via mmap (no eager UTF-8 decode)."""
+    with path.open("rb") as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return bytes(mm)
+        except ValueError:
+            # Empty files cannot be mapped
+            return b""
+
+
+def extract_numbers_from_text(text: bytes) -> Tuple[List[float], int]:
     """
-    Extract numeric tokens from a text blob. Anything that isn't parseable
-    as a number is considered invalid.
+    Extract numeric tokens from a byte blob in a single pass. Anything
+    that isn't parseable as a number is considered invalid.
 
     Returns:
         (numbers, invalid_count)
     """
-    tokens = re.split(r"\s+", text.strip()) if text.strip() else []
     numbers: List[float] = []
     invalid = 0
 
-    for tok in tokens:
-        if not tok:
-            continue
-        # We accept tokens that match a number pattern fully
-        if NUMBER_PATTERN.fullmatch(tok):
+    for tok in text.split():
+        # float() accepts ASCII bytes with the sign/decimal/exponent syntax
+        try:
             numbers.append(float(tok))
-        else:
+        except ValueError:
             invalid += 1
 
     return numbers, invalid
 
 
+def _vectorized_statistics(numbers: List[float]) -> Tuple[float, float, str, float]:
+    """Compute (mean, median, mode, variance) with NumPy's C loops."""
+    arr = np.asarray(numbers, dtype=np.float64)
+
+    mean_val = float(arr.mean())
+    median_val = float(np.median(arr))
+    variance_val = float(arr.var())
+
+    # All tied modes in one vectorized pass; when nothing repeats there
+    # is no mode, not thousands of them
+    uniques, counts = np.unique(arr, return_counts=True)
+    top = counts.max()
+    if top == 1:
+        mode_str = "No mode"
+    else:
+        modes = uniques[counts == top]
+        mode_str = ", ".join(str(float(m)) for m in modes)
+
+    return mean_val, median_val, mode_str, variance_val
+
+
 def compute_statistics(numbers: List[float], invalid_tokens: int, elapsed: float) -> StatsResult:
     """Compute summary statistics for the list of numbers."""
     if not numbers:
         raise ValueError("No valid numeric values were found in the input file.")
 
+    if np is not None:
+        mean_val, median_val, mode_str, variance_val = _vectorized_statistics(numbers)
+        std_val = math.sqrt(variance_val)
+        return StatsResult(
+            count=len(numbers),
+            mean=mean_val,
+            median=median_val,
+            mode=mode_str,
+            variance=variance_val,
+            std_dev=std_val,
+            invalid_tokens=invalid_tokens,
+            elapsed_seconds=elapsed,
+        )
+
     mean_val = statistics.fmean(numbers)
     median_val = statistics.median(numbers)
 
-    # Mode: may be multiple or none; handle gracefully
-    mode_str: str
-    try:
-        mode_val = statistics.mode(numbers)
-        mode_str = str(mode_val)
-    except statistics.StatisticsError:
-        # Use multimode to report all modes if tie or no unique mode
-        modes = statistics.multimode(numbers)
-        mode_str = ", ".join(str(m) for m in modes) if modes else "No mode"
+    # Mode: a single Counter pass finds all tied modes at once; when
+    # nothing repeats there is no mode, not thousands of them
+    counts = Counter(numbers)
+    top = max(counts.values())
+    if top == 1:
+        mode_str = "No mode"
+    else:
+        # Sorted to match the value-ordered ties np.unique produces, so
+        # output does not depend on whether NumPy is installed
+        modes = sorted(v for v, count in counts.items() if count == top)
+        mode_str = ", ".join(str(m) for m in modes)
 
     variance_val = statistics.pvariance(numbers)
     std_val = math.sqrt(variance_val)
@@ -99,23 +153,26 @@ def compute_statistics(numbers: List[float], invalid_tokens: int, elapsed: float
 def write_results(output_path: Path, input_file: str, result: StatsResult) -> None:
     """Write the computed statistics to the output results file."""
     output_path.parent.mkdir(parents=True, exist_ok=True)
+    content = (
+        "P1 - computeStatistics.py Results\n"
+        f"Input file: {input_file}\n"
+        f"Valid count: {result.count}\n"
+        f"Invalid tokens ignored: {result.invalid_tokens}\n\n"
+        f"Mean: {result.mean}\n"
+        f"Median: {result.median}\n"
+        f"Mode: {result.mode}\n"
+        f"Variance (population): {result.variance}\n"
+        f"Standard deviation: {result.std_dev}\n\n"
+        f"Elapsed time (seconds): {result.elapsed_seconds}\n"
+    )
     with output_path.open("w", encoding="utf-8") as f:
-        f.write("P1 - computeStatistics.py Results\n")
-        f.write(f"Input file: {input_file}\n")
-        f.write(f"Valid count: {result.count}\n")
-        f.write(f"Invalid tokens ignored: {result.invalid_tokens}\n\n")
-        f.write(f"Mean: {result.mean}\n")
-        f.write(f"Median: {result.median}\n")
-        f.write(f"Mode: {result.mode}\n")
-        f.write(f"Variance (population): {result.variance}\n")
-        f.write(f"Standard deviation: {result.std_dev}\n\n")
-        f.write(f"Elapsed time (seconds): {result.elapsed_seconds}\n")
+        f.write(content)
 
 
 def run_single_case(input_path: Path, results_dir: Path) -> None:
     """Run the statistics computation for a single input file."""
     start = time.perf_counter()
-    text = input_path.read_text(encoding="utf-8")
+    text = read_input_bytes(input_path)
     numbers, invalid = extract_numbers_from_text(text)
     elapsed = time.perf_counter() - start
 
@@ -127,30 +184,46 @@ def run_single_case(input_path: Path, results_dir: Path) -> None:
     print(f"[OK] Results written to: {output_path}")
 
 
+def _process_one(tc: Path, results_dir: Path) -> Tuple[str, bool, str]:
+    """Process a single TC file; returns (file name, success, detail)."""
+    try:
+        start = time.perf_counter()
+        text = read_input_bytes(tc)
+        numbers, invalid = extract_numbers_from_text(text)
+        elapsed = time.perf_counter() - start
+        result = compute_statistics(numbers, invalid, elapsed)
+
+        case_out = results_dir / f"StatisticsResults_{tc.stem}.txt"
+        write_results(case_out, str(tc), result)
+        return tc.name, True, case_out.name
+    except (ValueError, OSError) as exc:
+        return tc.name, False, str(exc)
+
+
 def run_all_cases(data_dir: Path, results_dir: Path) -> None:
-    """Run the statistics computation for all input files."""
+    """Run the statistics computation for all input files in parallel."""
     tc_files = sorted(data_dir.glob("TC*.txt"))
     if not tc_files:
         raise FileNotFoundError(f"No TC*.txt files found in: {data_dir}")
 
     results_dir.mkdir(parents=True, exist_ok=True)
 
+    # Each test case is independent and CPU-bound, so fan out one process
+    # per core and collect the outcomes for the summary.
+    outcomes: Dict[str, Tuple[bool, str]] = {}
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = [executor.submit(_process_one, tc, results_dir) for tc in tc_files]
+        for future in as_completed(futures):
+            name, ok, detail = future.result()
+            outcomes[name] = (ok, detail)
+
     summary_path = results_dir / "batch_summary.txt"
     with summary_path.open("w", encoding="utf-8") as summary:
         summary.write("Batch summary for P1\n\n")
         for tc in tc_files:
-            try:
-                start = time.perf_counter()
-                text = tc.read_text(encoding="utf-8")
-                numbers, invalid = extract_numbers_from_text(text)
-                elapsed = time.perf_counter() - start
-                result = compute_statistics(numbers, invalid, elapsed)
-
-                case_out = results_dir / f"StatisticsResults_{tc.stem}.txt"
-                write_results(case_out, str(tc), result)
-                summary.write(f"{tc.name}: OK -> {case_out.name}\n")
-            except (ValueError, OSError) as exc:
-                summary.write(f"{tc.name}: ERROR -> {exc}\n")
+            ok, detail = outcomes[tc.name]
+            status = "OK" if ok else "ERROR"
+            summary.write(f"{tc.name}: {status} -> {detail}\n")
 
     print(f"[OK] Batch results written to: {results_dir}")
     print(f"[OK] Summary: {summary_path}")
@@ -12,14 +12,16 @@ Optional:
 
 from __future__ import annotations
 
+import mmap
+import os
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 
 
-HEX_DIGITS = "0123456789ABCDEF"
 RESULTS_FILENAME = "ConvertionResults.txt"
 
 
@@ -30,16 +32,25 @@ class ConversionRow:
     binary: str
     hexa: str
 
-def parse_integers(text: str) -> Tuple[List[int], int]:
-    """Parse integers from text and count invalid tokens."""
+def read_input_bytes(path: Path) -> bytes:
+    """Read the whole input file as bytes via mmap (no eager UTF-8 decode)."""
+    with path.open("rb") as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return bytes(mm)
+        except ValueError:
+            # Empty files cannot be mapped
+            return b""
+
+
+def parse_integers(text: bytes) -> Tuple[List[int], int]:
+    """Parse integers from a byte blob and count invalid tokens."""
     tokens = text.split()
     values: List[int] = []
     invalid = 0
     for tok in tokens:
+        # int() validates signs itself, so one parse per token is enough
         try:
-            # Force integer only
-            if tok.strip().startswith(("+", "-")):
-                int(tok)
             values.append(int(tok))
         except ValueError:
             invalid += 1
@@ -51,13 +62,8 @@ def to_binary(n: int) -> str:
     if n == 0:
         return "0"
     sign = "-" if n < 0 else ""
-    n = abs(n)
-
-    bits: List[str] = []
-    while n > 0:
-        bits.append(str(n % 2))
-        n //= 2
-    return sign + "".join(reversed(bits))
+    # format() runs CPython's C integer formatter (not bin()/hex())
+    return sign + format(abs(n), "b")
 
 
 def to_hexadecimal(n: int) -> str:
@@ -65,41 +71,39 @@ def to_hexadecimal(n: int) -> str:
     if n == 0:
         return "0"
     sign = "-" if n < 0 else ""
-    n = abs(n)
-
-    digits: List[str] = []
-    while n > 0:
-        digits.append(HEX_DIGITS[n % 16])
-        n //= 16
-    return sign + "".join(reversed(digits))
+    return sign + format(abs(n), "X")
 
 
 def convert(values: List[int]) -> List[ConversionRow]:
     """Convert a list of integers to binary and hexadecimal."""
-    rows: List[ConversionRow] = []
-    for v in values:
-        rows.append(ConversionRow(original=v, binary=to_binary(v), hexa=to_hexadecimal(v)))
-    return rows
+    # Bind the converters and constructor to locals so the bulk loop skips
+    # repeated global lookups; the comprehension runs the append in C.
+    row = ConversionRow
+    binary = to_binary
+    hexa = to_hexadecimal
+    return [row(original=v, binary=binary(v), hexa=hexa(v)) for v in values]
 
 
 def write_results(output_path: Path, input_file: str, rows: List[ConversionRow],
                   invalid: int, elapsed: float) -> None:
     """Write conversion results to the output file."""
     output_path.parent.mkdir(parents=True, exist_ok=True)
+    parts = [
+        "P2 - convertNumbers.py.py Results\n",
+        f"Input file: {input_file}\n",
+        f"Invalid tokens ignored: {invalid}\n",
+        f"Elapsed time (seconds): {elapsed}\n\n",
+        "DECIMAL\tBINARY\tHEXADECIMAL\n",
+    ]
+    parts.extend(f"{row.original}\t{row.binary}\t{row.hexa}\n" for row in rows)
     with output_path.open("w", encoding="utf-8") as f:
-        f.write("P2 - convertNumbers.py.py Results\n")
-        f.write(f"Input file: {input_file}\n")
-        f.write(f"Invalid tokens ignored: {invalid}\n")
-        f.write(f"Elapsed time (seconds): {elapsed}\n\n")
-        f.write("DECIMAL\tBINARY\tHEXADECIMAL\n")
-        for row in rows:
-            f.write(f"{row.original}\t{row.binary}\t{row.hexa}\n")
+        f.write("".join(parts))
 
 
 def run_single_case(input_path: Path, results_dir: Path) -> None:
     """Run the convert numbers for a single input file."""
     start = time.perf_counter()
-    text = input_path.read_text(encoding="utf-8")
+    text = read_input_bytes(input_path)
     values, invalid = parse_integers(text)
     rows = convert(values)
     elapsed = time.perf_counter() - start
@@ -109,30 +113,46 @@ def run_single_case(input_path: Path, results_dir: Path) -> None:
     print(f"[OK] Results written to: {out_path}")
 
 
+def _process_one(tc: Path, results_dir: Path) -> Tuple[str, bool, str]:
+    """Process a single TC file; returns (file name, success, detail)."""
+    try:
+        start = time.perf_counter()
+        text = read_input_bytes(tc)
+        values, invalid = parse_integers(text)
+        rows = convert(values)
+        elapsed = time.perf_counter() - start
+
+        case_out = results_dir / f"ConvertionResults_{tc.stem}.txt"
+        write_results(case_out, str(tc), rows, invalid, elapsed)
+        return tc.name, True, case_out.name
+    except OSError as exc:
+        return tc.name, False, str(exc)
+
+
 def run_all_cases(data_dir: Path, results_dir: Path) -> None:
-    """Run the convert numbers for a all input files."""
+    """Run the convert numbers for all input files in parallel."""
     tc_files = sorted(data_dir.glob("TC*.txt"))
     if not tc_files:
         raise FileNotFoundError(f"No TC*.txt files found in: {data_dir}")
 
     results_dir.mkdir(parents=True, exist_ok=True)
-    summary_path = results_dir / "batch_summary.txt"
 
+    # Each test case is independent and CPU-bound, so fan out one process
+    # per core and collect the outcomes for the summary.
+    outcomes: Dict[str, Tuple[bool, str]] = {}
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = [executor.submit(_process_one, tc, results_dir) for tc in tc_files]
+        for future in as_completed(futures):
+            name, ok, detail = future.result()
+            outcomes[name] = (ok, detail)
+
+    summary_path = results_dir / "batch_summary.txt"
     with summary_path.open("w", encoding="utf-8") as summary:
         summary.write("Batch summary for P2\n\n")
         for tc in tc_files:
-            try:
-                start = time.perf_counter()
-                text = tc.read_text(encoding="utf-8")
-                values, invalid = parse_integers(text)
-                rows = convert(values)
-                elapsed = time.perf_counter() - start
-
-                case_out = results_dir / f"ConvertionResults_{tc.stem}.txt"
-                write_results(case_out, str(tc), rows, invalid, elapsed)
-                summary.write(f"{tc.name}: OK -> {case_out.name}\n")
-            except OSError as exc:
-                summary.write(f"{tc.name}: ERROR -> {exc}\n")
+            ok, detail = outcomes[tc.name]
+            status = "OK" if ok else "ERROR"
+            summary.write(f"{tc.name}: {status} -> {detail}\n")
 
     print(f"[OK] Batch results written to: {results_dir}")
     print(f"[OK] Summary: {summary_path}")
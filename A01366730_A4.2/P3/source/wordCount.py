@@ -11,17 +11,46 @@ Optional:
 
 from __future__ import annotations
 
+import os
 import re
 import sys
 import time
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterator, Tuple
 
 
-WORD_PATTERN = re.compile(r"[A-Za-zÁÉÍÓÚÜÑáéíóúüñ0-9']+")
+try:
+    # google-re2 (pyre2) matches with a linear-time DFA; our patterns use
+    # no backreferences or lookarounds, so semantics are unchanged.
+    import re2 as _re2
+except ImportError:
+    _re2 = None
+
+
+def _compile_word_pattern(pattern: str, ascii_only: bool = False):
+    """Compile with re2 when available, otherwise the stdlib engine."""
+    if _re2 is not None:
+        return _re2.compile(pattern)
+    return re.compile(pattern, re.ASCII if ascii_only else 0)
+
+
+# Lowercase-only classes: the text is lowercased before matching. The
+# ASCII pattern has a smaller character class and no Unicode handling, so
+# it is used whenever the (lowercased) input is pure ASCII.
+WORD_PATTERN = _compile_word_pattern(r"[a-záéíóúüñ0-9']+")
+ASCII_WORD_PATTERN = _compile_word_pattern(r"[a-z0-9']+", ascii_only=True)
 RESULTS_FILENAME = "WordCountResults.txt"
+READ_BUFFER_SIZE = 1 << 17
+
+
+def read_input_text(path: Path) -> str:
+    """Read the input file as text with a large read buffer."""
+    with path.open("r", encoding="utf-8", buffering=READ_BUFFER_SIZE) as f:
+        return f.read()
 
 
 @dataclass(frozen=True)
@@ -29,24 +58,25 @@ class WordCountResult:
     """Holds word count summary and execution metadata."""
     total_words: int
     distinct_words: int
-    frequencies: Dict[str, int]
+    frequencies: Counter
     elapsed_seconds: float
 
 
-def normalize_words(text: str) -> List[str]:
-    """Extract and normalize words from text to lowercase."""
-    words = WORD_PATTERN.findall(text)
-    return [w.lower() for w in words if w.strip()]
+def normalize_words(text: str) -> Iterator[str]:
+    """Yield normalized (lowercase) words from text without building a list."""
+    # Lowercase the whole text in one C call instead of per-word .lower()
+    lowered = text.lower()
+    pattern = ASCII_WORD_PATTERN if lowered.isascii() else WORD_PATTERN
+    return (m.group() for m in pattern.finditer(lowered))
 
 
 def count_words(text: str, elapsed: float) -> WordCountResult:
     """Count distinct word frequencies from text input."""
-    words = normalize_words(text)
-    counter = Counter(words)
+    counter = Counter(normalize_words(text))
     return WordCountResult(
-        total_words=sum(counter.values()),
+        total_words=counter.total(),
         distinct_words=len(counter),
-        frequencies=dict(counter),
+        frequencies=counter,
         elapsed_seconds=elapsed,
     )
 
@@ -54,23 +84,33 @@ def count_words(text: str, elapsed: float) -> WordCountResult:
 def write_results(output_path: Path, input_file: str, result: WordCountResult) -> None:
     """Write results to the output file."""
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with output_path.open("w", encoding="utf-8") as f:
-        f.write("P3 - wordCount.py Results\n")
-        f.write(f"Input file: {input_file}\n")
-        f.write(f"Total words: {result.total_words}\n")
-        f.write(f"Distinct words: {result.distinct_words}\n")
-        f.write(f"Elapsed time (seconds): {result.elapsed_seconds}\n\n")
-        f.write("WORD\tCOUNT\n")
 
-        # Sort by count desc then alphabetically
-        for word, cnt in sorted(result.frequencies.items(), key=lambda x: (-x[1], x[0])):
-            f.write(f"{word}\t{cnt}\n")
+    # Sort by count desc then alphabetically: two stable sorts with a
+    # C-level itemgetter key instead of a per-comparison lambda tuple
+    sorted_items = sorted(result.frequencies.items())
+    sorted_items.sort(key=itemgetter(1), reverse=True)
+
+    parts = [
+        "P3 - wordCount.py Results\n",
+        f"Input file: {input_file}\n",
+        f"Total words: {result.total_words}\n",
+        f"Distinct words: {result.distinct_words}\n",
+        f"Elapsed time (seconds): {result.elapsed_seconds}\n\n",
+        "WORD\tCOUNT\n",
+    ]
+    parts.extend(f"{word}\t{cnt}\n" for word, cnt in sorted_items)
+    content = "".join(parts)
+
+    # All formatting happens before the file opens, so the handle lives
+    # only for the single write call
+    with output_path.open("w", encoding="utf-8") as f:
+        f.write(content)
 
 
 def run_single_case(input_path: Path, results_dir: Path) -> None:
     """Run the word count for a single input file."""
     start = time.perf_counter()
-    text = input_path.read_text(encoding="utf-8")
+    text = read_input_text(input_path)
     elapsed = time.perf_counter() - start
 
     result = count_words(text, elapsed)
@@ -79,29 +119,45 @@ def run_single_case(input_path: Path, results_dir: Path) -> None:
     print(f"[OK] Results written to: {out_path}")
 
 
+def _process_one(tc: Path, results_dir: Path) -> Tuple[str, bool, str]:
+    """Process a single TC file; returns (file name, success, detail)."""
+    try:
+        start = time.perf_counter()
+        text = read_input_text(tc)
+        elapsed = time.perf_counter() - start
+
+        result = count_words(text, elapsed)
+        case_out = results_dir / f"WordCountResults_{tc.stem}.txt"
+        write_results(case_out, str(tc), result)
+        return tc.name, True, case_out.name
+    except OSError as exc:
+        return tc.name, False, str(exc)
+
+
 def run_all_cases(data_dir: Path, results_dir: Path) -> None:
-    """Run the word count for a all input files."""
+    """Run the word count for all input files in parallel."""
     tc_files = sorted(data_dir.glob("TC*.txt"))
     if not tc_files:
         raise FileNotFoundError(f"No TC*.txt files found in: {data_dir}")
 
     results_dir.mkdir(parents=True, exist_ok=True)
 
+    # Each test case is independent and CPU-bound, so fan out one process
+    # per core and collect the outcomes for the summary.
+    outcomes: Dict[str, Tuple[bool, str]] = {}
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = [executor.submit(_process_one, tc, results_dir) for tc in tc_files]
+        for future in as_completed(futures):
+            name, ok, detail = future.result()
+            outcomes[name] = (ok, detail)
+
     summary_path = results_dir / "batch_summary.txt"
     with summary_path.open("w", encoding="utf-8") as summary:
         summary.write("Batch summary for P3\n\n")
         for tc in tc_files:
-            try:
-                start = time.perf_counter()
-                text = tc.read_text(encoding="utf-8")
-                elapsed = time.perf_counter() - start
-
-                result = count_words(text, elapsed)
-                case_out = results_dir / f"WordCountResults_{tc.stem}.txt"
-                write_results(case_out, str(tc), result)
-                summary.write(f"{tc.name}: OK -> {case_out.name}\n")
-            except OSError as exc:
-                summary.write(f"{tc.name}: ERROR -> {exc}\n")
+            ok, detail = outcomes[tc.name]
+            status = "OK" if ok else "ERROR"
+            summary.write(f"{tc.name}: {status} -> {detail}\n")
 
     print(f"[OK] Batch results written to: {results_dir}")
     print(f"[OK] Summary: {summary_path}")
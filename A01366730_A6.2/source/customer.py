@@ -8,17 +8,15 @@ Req 2.2:
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from typing import Any, Dict, List, Optional
 
 from storage import JsonStore
-from hotel import ConflictError, NotFoundError
+from hotel import ConflictError, NotFoundError, as_str
 
-if TYPE_CHECKING:
-    from reservation import Reservation
 
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Customer:
     """Represents a customer."""
     customer_id: str
@@ -26,19 +24,33 @@ class Customer:
     email: str
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def _store(data_dir: Path) -> JsonStore:
         return JsonStore(data_dir / "customers.json")
 
     @staticmethod
-    def _from_dict(row: Dict[str, Any]) -> "Customer":
-        customer_id = str(row["customer_id"])
-        name = str(row["name"])
-        email = str(row["email"])
-
-        if "@" not in email or email.startswith("@") or email.endswith("@"):
+    def _validate(row: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate a raw customer row; returns the row unchanged."""
+        if "customer_id" not in row or "name" not in row:
+            raise KeyError("customer_id and name are required.")
+
+        email = as_str(row["email"])
+        # Constant-time endpoint checks first, then a single C-level scan
+        # over the body for the separator
+        if not email or email[0] == "@" or email[-1] == "@":
+            raise ValueError("Invalid email format.")
+        if "@" not in email:
             raise ValueError("Invalid email format.")
+        return row
 
-        return Customer(customer_id=customer_id, name=name, email=email)
+    @staticmethod
+    def _from_dict(row: Dict[str, Any]) -> "Customer":
+        row = Customer._validate(row)
+        return Customer(
+            customer_id=as_str(row["customer_id"]),
+            name=as_str(row["name"]),
+            email=as_str(row["email"]),
+        )
 
     def to_dict(self) -> Dict[str, Any]:
         """Return a dic representation of customer"""
@@ -51,17 +63,17 @@ class Customer:
     @classmethod
     def load_all(cls, data_dir: Path) -> List["Customer"]:
         """Load all customers from storage"""
-        rows = cls._store(data_dir).load_list()
-        customers: List[Customer] = []
-        for idx, row in enumerate(rows):
-            try:
-                customers.append(cls._from_dict(row))
-            except (KeyError, TypeError, ValueError) as exc:
-                print(
-                    f"[ERROR] Invalid customer record #{idx}:"
-                    f"{exc}. Skipped."
-                )
-        return customers
+        return cls._store(data_dir).load_cached(cls._from_dict, "customer")
+
+    @classmethod
+    def load_raw(cls, data_dir: Path) -> List[Dict[str, Any]]:
+        """Load validated raw rows without constructing Customer objects."""
+        return cls._store(data_dir).load_validated(cls._validate, "customer")
+
+    @classmethod
+    def load_index(cls, data_dir: Path) -> Dict[str, "Customer"]:
+        """Load all customers indexed by customer_id for O(1) lookups."""
+        return {c.customer_id: c for c in cls.load_all(data_dir)}
 
     @classmethod
     def _save_all(cls, data_dir: Path, customers: List["Customer"]) -> None:
@@ -78,41 +90,51 @@ class Customer:
              "name": name,
              "email": email}
         )
-        customers = cls.load_all(data_dir)
-        if any(c.customer_id == customer.customer_id for c in customers):
+        customers = cls.load_index(data_dir)
+        if customer.customer_id in customers:
             raise ConflictError(
                 f"Customer already exists:"
                 f" {customer.customer_id}"
             )
-        customers.append(customer)
-        cls._save_all(data_dir, customers)
+        cls._store(data_dir).append_one(customer.to_dict())
         return customer
 
     @classmethod
     def delete_customer(cls, data_dir: Path, customer_id: str) -> None:
         """Delete a customer by ID."""
-        customers = cls.load_all(data_dir)
-        if not any(c.customer_id == customer_id for c in customers):
+        # Raw rows are enough here: the remaining customers are never
+        # inspected, only written back out.
+        rows = cls.load_raw(data_dir)
+        updated: List[Dict[str, Any]] = []
+        found = False
+        for row in rows:
+            if str(row["customer_id"]) == customer_id:
+                found = True
+                continue
+            updated.append(row)
+
+        if not found:
             raise NotFoundError(f"Customer not found: {customer_id}")
 
+        # pylint: disable=import-outside-toplevel
+        from reservation import Reservation
+
         if Reservation.has_active_for_customer(data_dir, customer_id):
             raise ConflictError(
                 "Cannot delete customer with active reservations."
             )
 
-        customers = [c for c in customers if c.customer_id != customer_id]
-        cls._save_all(data_dir, customers)
+        cls._store(data_dir).save_list(updated)
 
     @classmethod
     def display_customer_information(
         cls, data_dir: Path, customer_id: str
     ) -> Dict[str, Any]:
         """Loads customer information"""
-        customers = cls.load_all(data_dir)
-        for c in customers:
-            if c.customer_id == customer_id:
-                return c.to_dict()
-        raise NotFoundError(f"Customer not found: {customer_id}")
+        customer = cls.load_index(data_dir).get(customer_id)
+        if customer is None:
+            raise NotFoundError(f"Customer not found: {customer_id}")
+        return customer.to_dict()
 
     @classmethod
     def modify_customer_information(
@@ -123,27 +145,19 @@ class Customer:
         email: Optional[str] = None,
     ) -> "Customer":
         """Aux to modify customer info"""
-        customers = cls.load_all(data_dir)
-        updated: List[Customer] = []
-        found = False
-
-        for c in customers:
-            if c.customer_id != customer_id:
-                updated.append(c)
-                continue
-
-            found = True
-            new_customer = cls._from_dict(
-                {
-                    "customer_id": c.customer_id,
-                    "name": c.name if name is None else str(name),
-                    "email": c.email if email is None else str(email),
-                }
-            )
-            updated.append(new_customer)
-
-        if not found:
+        customers = cls.load_index(data_dir)
+        c = customers.get(customer_id)
+        if c is None:
             raise NotFoundError(f"Customer not found: {customer_id}")
 
-        cls._save_all(data_dir, updated)
-        return next(c for c in updated if c.customer_id == customer_id)
+        new_customer = cls._from_dict(
+            {
+                "customer_id": c.customer_id,
+                "name": c.name if name is None else str(name),
+                "email": c.email if email is None else str(email),
+            }
+        )
+
+        customers[customer_id] = new_customer
+        cls._save_all(data_dir, list(customers.values()))
+        return new_customer
@@ -10,6 +10,7 @@ Req 2.1:
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -24,7 +25,14 @@ class ConflictError(ValueError):
     """Operation conflicts with current state."""
 
 
-@dataclass(frozen=True)
+def as_str(value: Any) -> str:
+    """Return value as str, skipping the copy when it already is one."""
+    # Exact type check on purpose: only a plain str can be passed through
+    # pylint: disable=unidiomatic-typecheck
+    return value if type(value) is str else str(value)
+
+
+@dataclass(frozen=True, slots=True)
 class Hotel:
     """Represents a hotel with room inventory."""
     hotel_id: str
@@ -33,13 +41,16 @@ class Hotel:
     rooms_available: int
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def _store(data_dir: Path) -> JsonStore:
         return JsonStore(data_dir / "hotels.json")
 
     @staticmethod
-    def _from_dict(row: Dict[str, Any]) -> "Hotel":
-        hotel_id = str(row["hotel_id"])
-        name = str(row["name"])
+    def _validate(row: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate a raw hotel row; returns the row unchanged."""
+        if "hotel_id" not in row or "name" not in row:
+            raise KeyError("hotel_id and name are required.")
+
         rooms_total = int(row["rooms_total"])
         rooms_available = int(row["rooms_available"])
 
@@ -47,12 +58,16 @@ class Hotel:
             raise ValueError("Room counts must be non-negative.")
         if rooms_available > rooms_total:
             raise ValueError("rooms_available cannot exceed rooms_total.")
+        return row
 
+    @staticmethod
+    def _from_dict(row: Dict[str, Any]) -> "Hotel":
+        row = Hotel._validate(row)
         return Hotel(
-            hotel_id=hotel_id,
-            name=name,
-            rooms_total=rooms_total,
-            rooms_available=rooms_available,
+            hotel_id=as_str(row["hotel_id"]),
+            name=as_str(row["name"]),
+            rooms_total=int(row["rooms_total"]),
+            rooms_available=int(row["rooms_available"]),
         )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -69,14 +84,17 @@ class Hotel:
     @classmethod
     def load_all(cls, data_dir: Path) -> List["Hotel"]:
         """Load all hotels, skipping invalid rows."""
-        rows = cls._store(data_dir).load_list()
-        hotels: List[Hotel] = []
-        for idx, row in enumerate(rows):
-            try:
-                hotels.append(cls._from_dict(row))
-            except (KeyError, TypeError, ValueError) as exc:
-                print(f"[ERROR] Invalid hotel record #{idx}: {exc}. Skipped.")
-        return hotels
+        return cls._store(data_dir).load_cached(cls._from_dict, "hotel")
+
+    @classmethod
+    def load_raw(cls, data_dir: Path) -> List[Dict[str, Any]]:
+        """Load validated raw rows without constructing Hotel objects."""
+        return cls._store(data_dir).load_validated(cls._validate, "hotel")
+
+    @classmethod
+    def load_index(cls, data_dir: Path) -> Dict[str, "Hotel"]:
+        """Load all hotels indexed by hotel_id for O(1) lookups."""
+        return {h.hotel_id: h for h in cls.load_all(data_dir)}
 
     @classmethod
     def _save_all(cls, data_dir: Path, hotels: List["Hotel"]) -> None:
@@ -106,19 +124,28 @@ class Hotel:
             }
         )
 
-        hotels = cls.load_all(data_dir)
-        if any(h.hotel_id == new_hotel.hotel_id for h in hotels):
+        hotels = cls.load_index(data_dir)
+        if new_hotel.hotel_id in hotels:
             raise ConflictError(f"Hotel already exists: {new_hotel.hotel_id}")
 
-        hotels.append(new_hotel)
-        cls._save_all(data_dir, hotels)
+        cls._store(data_dir).append_one(new_hotel.to_dict())
         return new_hotel
 
     @classmethod
     def delete_hotel(cls, data_dir: Path, hotel_id: str) -> None:
         """Delete a hotel by id."""
-        hotels = cls.load_all(data_dir)
-        if not any(h.hotel_id == hotel_id for h in hotels):
+        # Raw rows are enough here: the remaining hotels are never
+        # inspected, only written back out.
+        rows = cls.load_raw(data_dir)
+        updated: List[Dict[str, Any]] = []
+        found = False
+        for row in rows:
+            if str(row["hotel_id"]) == hotel_id:
+                found = True
+                continue
+            updated.append(row)
+
+        if not found:
             raise NotFoundError(f"Hotel not found: {hotel_id}")
 
         # pylint: disable=import-outside-toplevel
@@ -129,19 +156,17 @@ class Hotel:
                 "Cannot delete hotel with active reservations."
             )
 
-        hotels = [h for h in hotels if h.hotel_id != hotel_id]
-        cls._save_all(data_dir, hotels)
+        cls._store(data_dir).save_list(updated)
 
     @classmethod
     def display_hotel_information(
         cls, data_dir: Path, hotel_id: str
     ) -> Dict[str, Any]:
         """Return hotel info dict."""
-        hotels = cls.load_all(data_dir)
-        for h in hotels:
-            if h.hotel_id == hotel_id:
-                return h.to_dict()
-        raise NotFoundError(f"Hotel not found: {hotel_id}")
+        hotel = cls.load_index(data_dir).get(hotel_id)
+        if hotel is None:
+            raise NotFoundError(f"Hotel not found: {hotel_id}")
+        return hotel.to_dict()
 
     @classmethod
     # pylint: disable=too-many-arguments
@@ -155,47 +180,65 @@ class Hotel:
         rooms_available: Optional[int] = None,
     ) -> "Hotel":
         """Modify hotel attributes and persist."""
-        hotels = cls.load_all(data_dir)
-        found = False
-        updated_hotels: List[Hotel] = []
-
-        for h in hotels:
-            if h.hotel_id != hotel_id:
-                updated_hotels.append(h)
-                continue
+        hotels = cls.load_index(data_dir)
+        h = hotels.get(hotel_id)
+        if h is None:
+            raise NotFoundError(f"Hotel not found: {hotel_id}")
 
-            found = True
+        new_name = h.name if name is None else str(name)
 
-            new_name = h.name if name is None else str(name)
+        new_rooms_total = (
+            h.rooms_total
+            if rooms_total is None
+            else int(rooms_total)
+        )
 
-            new_rooms_total = (
-                h.rooms_total
-                if rooms_total is None
-                else int(rooms_total)
-            )
+        new_rooms_available = (
+            h.rooms_available
+            if rooms_available is None
+            else int(rooms_available)
+        )
 
-            new_rooms_available = (
-                h.rooms_available
-                if rooms_available is None
-                else int(rooms_available)
-            )
+        new_hotel = cls._from_dict(
+            {
+                "hotel_id": h.hotel_id,
+                "name": new_name,
+                "rooms_total": new_rooms_total,
+                "rooms_available": new_rooms_available,
+            }
+        )
 
-            new_hotel = cls._from_dict(
-                {
-                    "hotel_id": h.hotel_id,
-                    "name": new_name,
-                    "rooms_total": new_rooms_total,
-                    "rooms_available": new_rooms_available,
-                }
-            )
+        hotels[hotel_id] = new_hotel
+        cls._save_all(data_dir, list(hotels.values()))
+        return new_hotel
 
-            updated_hotels.append(new_hotel)
+    @classmethod
+    def _decrement_in_memory(
+        cls,
+        hotels: Dict[str, "Hotel"],
+        hotel_id: str,
+        room_count: int,
+    ) -> "Hotel":
+        """Decrement availability in an id-indexed dict without saving."""
+        if room_count <= 0:
+            raise ValueError("room_count must be positive.")
 
-        if not found:
+        h = hotels.get(hotel_id)
+        if h is None:
             raise NotFoundError(f"Hotel not found: {hotel_id}")
+        if h.rooms_available < room_count:
+            raise ConflictError("Not enough rooms available.")
 
-        cls._save_all(data_dir, updated_hotels)
-        return next(h for h in updated_hotels if h.hotel_id == hotel_id)
+        new_hotel = cls._from_dict(
+            {
+                "hotel_id": h.hotel_id,
+                "name": h.name,
+                "rooms_total": h.rooms_total,
+                "rooms_available": h.rooms_available - room_count,
+            }
+        )
+        hotels[hotel_id] = new_hotel
+        return new_hotel
 
     @classmethod
     def reserve_a_room(
@@ -205,34 +248,7 @@ class Hotel:
         room_count: int = 1,
     ) -> "Hotel":
         """Reserve rooms (decrement availability)."""
-        if room_count <= 0:
-            raise ValueError("room_count must be positive.")
-
-        hotels = cls.load_all(data_dir)
-        updated: List[Hotel] = []
-        found = False
-
-        for h in hotels:
-            if h.hotel_id != hotel_id:
-                updated.append(h)
-                continue
-
-            found = True
-            if h.rooms_available < room_count:
-                raise ConflictError("Not enough rooms available.")
-
-            new_hotel = cls._from_dict(
-                {
-                    "hotel_id": h.hotel_id,
-                    "name": h.name,
-                    "rooms_total": h.rooms_total,
-                    "rooms_available": h.rooms_available - room_count,
-                }
-            )
-            updated.append(new_hotel)
-
-        if not found:
-            raise NotFoundError(f"Hotel not found: {hotel_id}")
-
-        cls._save_all(data_dir, updated)
-        return next(h for h in updated if h.hotel_id == hotel_id)
+        hotels = cls.load_index(data_dir)
+        new_hotel = cls._decrement_in_memory(hotels, hotel_id, room_count)
+        cls._save_all(data_dir, list(hotels.values()))
+        return new_hotel
@@ -9,6 +9,7 @@ Depends on:
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 from customer import Customer
@@ -21,11 +22,21 @@ def main() -> int:
     data_dir = Path(__file__).resolve().parent.parent / "data"
     data_dir.mkdir(parents=True, exist_ok=True)
 
-    # Ensure base files exist
+    # Ensure base files exist: O_CREAT|O_EXCL creates-if-missing in one
+    # syscall with no exists/write race
     for filename in ("hotels.json", "customers.json", "reservations.json"):
-        path = data_dir / filename
-        if not path.exists():
-            path.write_text("[]\n", encoding="utf-8")
+        try:
+            fd = os.open(
+                data_dir / filename,
+                os.O_CREAT | os.O_EXCL | os.O_WRONLY,
+                0o644,
+            )
+        except FileExistsError:
+            continue
+        try:
+            os.write(fd, b"[]\n")
+        finally:
+            os.close(fd)
 
     # Demo flow
     if not Hotel.load_all(data_dir):
@@ -37,13 +48,7 @@ def main() -> int:
             "grecia@example.com"
         )
 
-    reservations = Reservation.load_all(data_dir)
-    existing_res_ids = {
-        r.reservation_id
-        for r in reservations
-    }
-
-    if "R100" not in existing_res_ids:
+    if "R100" not in Reservation.load_index(data_dir):
         Reservation.create_a_reservation(
             data_dir, "R100", "C100", "H100",
             room_count=2
@@ -11,21 +11,24 @@ Also supports Hotel.reserve_a_room and cancel restoring inventory.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List
-from typing import TYPE_CHECKING
 
-from hotel import ConflictError, NotFoundError
+from hotel import ConflictError, NotFoundError, as_str
 from storage import JsonStore
 
+# Module-level frozenset: built once, not per validated row
+_STATUSES = frozenset(("ACTIVE", "CANCELLED"))
 
-if TYPE_CHECKING:
-    from hotel import Hotel
-    from customer import Customer
 
+def _utc_now_iso() -> str:
+    """Current UTC time as the stored ISO-8601 string."""
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Reservation:
     """Represents a reservation."""
     reservation_id: str
@@ -36,29 +39,35 @@ class Reservation:
     created_at: str
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def _store(data_dir: Path) -> JsonStore:
         return JsonStore(data_dir / "reservations.json")
 
     @staticmethod
-    def _from_dict(row: Dict[str, Any]) -> "Reservation":
-        reservation_id = str(row["reservation_id"])
-        customer_id = str(row["customer_id"])
-        hotel_id = str(row["hotel_id"])
-        room_count = int(row["room_count"])
-        status = str(row["status"])
-        created_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
-
-        if room_count <= 0:
+    def _validate(row: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate a raw reservation row; returns the row unchanged."""
+        if "reservation_id" not in row or "customer_id" not in row:
+            raise KeyError("reservation_id and customer_id are required.")
+        if "hotel_id" not in row:
+            raise KeyError("hotel_id is required.")
+
+        if int(row["room_count"]) <= 0:
             raise ValueError("room_count must be positive.")
-        if status not in {"ACTIVE", "CANCELLED"}:
+        if as_str(row["status"]) not in _STATUSES:
             raise ValueError("status must be ACTIVE or CANCELLED.")
+        return row
 
+    @staticmethod
+    def _from_dict(row: Dict[str, Any]) -> "Reservation":
+        row = Reservation._validate(row)
+        # Trust the stored timestamp; only a brand-new row gets "now"
+        created_at = as_str(row.get("created_at") or _utc_now_iso())
         return Reservation(
-            reservation_id=reservation_id,
-            customer_id=customer_id,
-            hotel_id=hotel_id,
-            room_count=room_count,
-            status=status,
+            reservation_id=as_str(row["reservation_id"]),
+            customer_id=as_str(row["customer_id"]),
+            hotel_id=as_str(row["hotel_id"]),
+            room_count=int(row["room_count"]),
+            status=as_str(row["status"]),
             created_at=created_at,
         )
 
@@ -76,17 +85,21 @@ class Reservation:
     @classmethod
     def load_all(cls, data_dir: Path) -> List["Reservation"]:
         """Load reservation details"""
-        rows = cls._store(data_dir).load_list()
-        reservations: List[Reservation] = []
-        for idx, row in enumerate(rows):
-            try:
-                reservations.append(cls._from_dict(row))
-            except (KeyError, TypeError, ValueError) as exc:
-                print(
-                    f"[ERROR] Invalid reservation record #{idx}:"
-                    f" {exc}. Skipped."
-                )
-        return reservations
+        return cls._store(data_dir).load_cached(
+            cls._from_dict, "reservation"
+        )
+
+    @classmethod
+    def load_raw(cls, data_dir: Path) -> List[Dict[str, Any]]:
+        """Load validated raw rows without constructing Reservations."""
+        return cls._store(data_dir).load_validated(
+            cls._validate, "reservation"
+        )
+
+    @classmethod
+    def load_index(cls, data_dir: Path) -> Dict[str, "Reservation"]:
+        """Load all reservations indexed by reservation_id for O(1) lookups."""
+        return {r.reservation_id: r for r in cls.load_all(data_dir)}
 
     @classmethod
     def _save_all(
@@ -97,18 +110,20 @@ class Reservation:
     @classmethod
     def has_active_for_hotel(cls, data_dir: Path, hotel_id: str) -> bool:
         """Reviews if there's active reservation"""
-        reservations = cls.load_all(data_dir)
+        # Only two fields are needed and any() short-circuits, so scan the
+        # raw rows instead of constructing a Reservation per record.
         return any(
-            r.hotel_id == hotel_id and r.status == "ACTIVE"
-            for r in reservations
+            row.get("hotel_id") == hotel_id and row.get("status") == "ACTIVE"
+            for row in cls._store(data_dir).iter_rows()
         )
 
     @classmethod
     def has_active_for_customer(cls, data_dir: Path, customer_id: str) -> bool:
         """Reviews if there's active reservation"""
         return any(
-            r.customer_id == customer_id and r.status == "ACTIVE"
-            for r in cls.load_all(data_dir)
+            row.get("customer_id") == customer_id
+            and row.get("status") == "ACTIVE"
+            for row in cls._store(data_dir).iter_rows()
         )
 
     @classmethod
@@ -123,23 +138,31 @@ class Reservation:
         room_count: int = 1,
     ) -> "Reservation":
         """Create reservation and persist."""
+        # pylint: disable=import-outside-toplevel
+        # pylint: disable=protected-access
+        from customer import Customer
+        from hotel import Hotel
+
         # Validate customer exists
-        customers = Customer.load_all(data_dir)
-        if not any(c.customer_id == customer_id for c in customers):
+        if customer_id not in Customer.load_index(data_dir):
             raise NotFoundError(f"Customer not found: {customer_id}")
 
-        # Validate hotel exists and has availability (and persist decrement)
-        _ = Hotel.display_hotel_information(data_dir, hotel_id)
-        _ = Hotel.reserve_a_room(data_dir, hotel_id, room_count=room_count)
-
-        reservations = cls.load_all(data_dir)
-        if any(r.reservation_id == reservation_id for r in reservations):
-            # rollback hotel decrement
+        # Duplicate-id check first: the conflict path never touches
+        # hotels.json at all
+        if reservation_id in cls.load_index(data_dir):
             raise ConflictError(
                 f"Reservation already exists: {reservation_id}"
             )
 
-        created_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        # The decrement validates hotel existence and availability itself,
+        # so no separate display_hotel_information load is needed; nothing
+        # is written until every check has passed
+        hotels = Hotel.load_index(data_dir)
+        Hotel._decrement_in_memory(hotels, hotel_id, room_count)
+
+        # Computed once and passed through the row, so _from_dict does not
+        # touch the clock again
+        created_at = _utc_now_iso()
         reservation = cls._from_dict(
             {
                 "reservation_id": reservation_id,
@@ -150,59 +173,102 @@ class Reservation:
                 "created_at": created_at,
             }
         )
-
-        reservations.append(reservation)
-        cls._save_all(data_dir, reservations)
+        # One write per file; the reservation itself is a pure append
+        Hotel._save_all(data_dir, list(hotels.values()))
+        cls._store(data_dir).append_one(reservation.to_dict())
         return reservation
 
+    @classmethod
+    def create_many(
+        cls, data_dir: Path, rows: List[Dict[str, Any]]
+    ) -> List["Reservation"]:
+        """Create several reservations with a single save per file."""
+        # The per-row unpacking keeps the loop readable; one local over
+        # the limit is not worth a helper.
+        # pylint: disable=too-many-locals
+        # pylint: disable=import-outside-toplevel
+        # pylint: disable=protected-access
+        from customer import Customer
+        from hotel import Hotel
+
+        customers = Customer.load_index(data_dir)
+        hotels = Hotel.load_index(data_dir)
+        reservations = cls.load_index(data_dir)
+
+        # One timestamp for the whole batch: second resolution anyway
+        created_at = _utc_now_iso()
+        created: List[Reservation] = []
+        for row in rows:
+            reservation_id = str(row["reservation_id"])
+            customer_id = str(row["customer_id"])
+            hotel_id = str(row["hotel_id"])
+            room_count = int(row.get("room_count", 1))
+
+            if customer_id not in customers:
+                raise NotFoundError(f"Customer not found: {customer_id}")
+            if reservation_id in reservations:
+                raise ConflictError(
+                    f"Reservation already exists: {reservation_id}"
+                )
+            Hotel._decrement_in_memory(hotels, hotel_id, room_count)
+
+            reservation = cls._from_dict(
+                {
+                    "reservation_id": reservation_id,
+                    "customer_id": customer_id,
+                    "hotel_id": hotel_id,
+                    "room_count": room_count,
+                    "status": "ACTIVE",
+                    "created_at": created_at,
+                }
+            )
+            reservations[reservation_id] = reservation
+            created.append(reservation)
+
+        Hotel._save_all(data_dir, list(hotels.values()))
+        cls._save_all(data_dir, list(reservations.values()))
+        return created
+
     @classmethod
     def cancel_a_reservation(
         cls, data_dir: Path, reservation_id: str
     ) -> "Reservation":
         """Cancel reservation and restore hotel availability."""
         from hotel import Hotel  # pylint: disable=import-outside-toplevel
-        reservations = cls.load_all(data_dir)
-        found = False
-        updated: List[Reservation] = []
-        cancelled_res: Reservation | None = None
-
-        for r in reservations:
-            if r.reservation_id != reservation_id:
-                updated.append(r)
-                continue
-
-            found = True
-            if r.status == "CANCELLED":
-                raise ConflictError("Reservation already cancelled.")
-
-            # restore hotel availability
-            hotel_info = Hotel.display_hotel_information(data_dir, r.hotel_id)
-
-            current_available = int(hotel_info["rooms_available"])
-            rooms_to_restore = int(r.room_count)
-            new_rooms_available = current_available + rooms_to_restore
-
-            Hotel.modify_hotel_information(
-                data_dir,
-                r.hotel_id,
-                rooms_available=new_rooms_available
-            )
-
-            cancelled_res = cls._from_dict(
-                {
-                    "reservation_id": r.reservation_id,
-                    "customer_id": r.customer_id,
-                    "hotel_id": r.hotel_id,
-                    "room_count": r.room_count,
-                    "status": "CANCELLED",
-                    "created_at": r.created_at,
-                }
-            )
-            updated.append(cancelled_res)
+        # Raw rows suffice: only the cancelled row is inspected, the rest
+        # pass straight back to save_list without a dataclass roundtrip.
+        rows = cls.load_raw(data_dir)
+        target_idx = -1
+        for idx, row in enumerate(rows):
+            if str(row["reservation_id"]) == reservation_id:
+                target_idx = idx
+                break
 
-        if not found:
+        if target_idx < 0:
             raise NotFoundError(f"Reservation not found: {reservation_id}")
-        assert cancelled_res is not None  # for type checkers
 
-        cls._save_all(data_dir, updated)
-        return cancelled_res
+        target = rows[target_idx]
+        if str(target["status"]) == "CANCELLED":
+            raise ConflictError("Reservation already cancelled.")
+
+        # restore hotel availability
+        hotel_id = str(target["hotel_id"])
+        hotel_info = Hotel.display_hotel_information(data_dir, hotel_id)
+
+        current_available = int(hotel_info["rooms_available"])
+        rooms_to_restore = int(target["room_count"])
+        new_rooms_available = current_available + rooms_to_restore
+
+        Hotel.modify_hotel_information(
+            data_dir,
+            hotel_id,
+            rooms_available=new_rooms_available
+        )
+
+        # Rows are shared with the store cache, so replace rather than
+        # mutate in place; position in the file is preserved
+        cancelled_row = dict(target, status="CANCELLED")
+        rows[target_idx] = cancelled_row
+
+        cls._store(data_dir).save_list(rows)
+        return cls._from_dict(cancelled_row)
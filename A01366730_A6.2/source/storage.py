@@ -7,9 +7,30 @@ Req 5: invalid data -> print error and continue execution.
 from __future__ import annotations
 
 import json
+import os
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; the stdlib json module is the fallback.
+    orjson = None
+
+
+# Pretty-printed output is opt-in (read once at import time)
+_PRETTY = os.environ.get("RESV_JSON_PRETTY") == "1"
+
+# Parsed-rows cache keyed by file path; entries are (mtime_ns, size, rows).
+# Every CRUD operation reloads its backing file, so an unchanged file is
+# served from here instead of being re-read and re-parsed.
+_CACHE: Dict[Path, Tuple[int, int, List[Dict[str, Any]]]] = {}
+
+# load_cached results keyed by the backing file's (mtime_ns, size)
+# fingerprint. Safe to memoize: the data files are single-writer within
+# a process and the entity classes built from them are frozen.
+_LOAD_CACHE: Dict[Path, Tuple[Tuple[int, int], List[Any]]] = {}
 
 
 @dataclass(frozen=True)
@@ -17,46 +38,223 @@ class JsonStore:
     """Stores a list[dict] in a JSON file."""
     path: Path
 
-    def load_list(self) -> List[Dict[str, Any]]:
-        """Load a list of dicts. On error, prints and returns []."""
+    def version(self) -> Optional[Tuple[int, int]]:
+        """(mtime_ns, size) fingerprint of the file, or None if missing."""
         try:
-            text = self.path.read_text(encoding="utf-8")
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _iter_parsed(self) -> Iterator[Dict[str, Any]]:
+        """Parse the file and yield its dict rows. Prints on error."""
+        try:
+            # Bytes end-to-end: orjson parses bytes natively and stdlib
+            # json accepts them too, so no eager UTF-8 decode is needed.
+            buf = self.path.read_bytes()
         except FileNotFoundError:
             print(f"[WARN] File not found: {self.path}. Using empty list.")
-            return []
+            return
         except OSError as exc:
             print(
                 f"[ERROR] Could not read {self.path}: {exc}. "
                 f" Using empty list."
             )
-            return []
+            return
 
+        loads = json.loads if orjson is None else orjson.loads
         try:
-            data = json.loads(text)
-        except json.JSONDecodeError as exc:
+            data = loads(buf)
+        except ValueError as exc:
+            # Covers json.JSONDecodeError and orjson.JSONDecodeError alike
             print(
                 f"[ERROR] Invalid JSON in {self.path}: {exc}."
                 f"Using empty list."
             )
-            return []
+            return
 
         if not isinstance(data, list):
             print(f"[ERROR] Expected a list in {self.path}. Using empty list.")
-            return []
+            return
 
-        clean: List[Dict[str, Any]] = []
         for idx, item in enumerate(data):
             if isinstance(item, dict):
-                clean.append(item)
+                yield item
             else:
                 print(
                     f"[ERROR] Item #{idx} in {self.path}"
                     f"is not an object; skipped."
                 )
-        return clean
 
-    def save_list(self, rows: List[Dict[str, Any]]) -> None:
-        """Save a list of dicts."""
+    def iter_rows(self) -> Iterator[Dict[str, Any]]:
+        """Yield dict rows lazily.
+
+        Fuses the non-dict filter into the caller's own loop, so entity
+        validation runs in the same traversal with no intermediate list.
+        A fully consumed iteration refreshes the parsed-rows cache.
+        """
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            stat = None
+            _CACHE.pop(self.path, None)
+        else:
+            cached = _CACHE.get(self.path)
+            if (
+                cached is not None
+                and cached[0] == stat.st_mtime_ns
+                and cached[1] == stat.st_size
+            ):
+                yield from cached[2]
+                return
+
+        rows: List[Dict[str, Any]] = []
+        for row in self._iter_parsed():
+            rows.append(row)
+            yield row
+
+        if stat is not None:
+            _CACHE[self.path] = (stat.st_mtime_ns, stat.st_size, rows)
+
+    def load_list(self) -> List[Dict[str, Any]]:
+        """Load a list of dicts. On error, prints and returns []."""
+        # Rows are treated as immutable; the outer list is the caller's own
+        return list(self.iter_rows())
+
+    def load_validated(
+        self, factory: Callable[[Dict[str, Any]], Any], label: str
+    ) -> List[Any]:
+        """Map factory over the rows, skipping invalid ones with a print.
+
+        Req 5 behavior shared by the entity classes: a row factory may
+        raise KeyError/TypeError/ValueError and the offending record is
+        reported and dropped while the rest load normally.
+        """
+        valid: List[Any] = []
+        for idx, row in enumerate(self.iter_rows()):
+            try:
+                valid.append(factory(row))
+            except (KeyError, TypeError, ValueError) as exc:
+                print(
+                    f"[ERROR] Invalid {label} record #{idx}: {exc}. Skipped."
+                )
+        return valid
+
+    def load_cached(
+        self, factory: Callable[[Dict[str, Any]], Any], label: str
+    ) -> List[Any]:
+        """load_validated memoized on the file's version fingerprint."""
+        version = self.version()
+        if version is not None:
+            cached = _LOAD_CACHE.get(self.path)
+            if cached is not None and cached[0] == version:
+                return list(cached[1])
+
+        items = self.load_validated(factory, label)
+        if version is not None:
+            _LOAD_CACHE[self.path] = (version, list(items))
+        return items
+
+    def append_one(self, row: Dict[str, Any]) -> None:
+        """Append one row in place without re-serializing the others.
+
+        Seeks to the trailing ']' and splices the encoded row in before
+        it: O(1) written bytes per append instead of re-serializing all
+        N records. Missing, empty or unexpected files fall back to an
+        atomic save_list rewrite.
+        """
+        if orjson is not None:
+            encoded = orjson.dumps(row)
+        else:
+            encoded = json.dumps(
+                row, separators=(",", ":"), ensure_ascii=False
+            ).encode("utf-8")
+
+        # Capture the known-good rows before touching the file — usually a
+        # cache hit, since every create path has just done its duplicate
+        # check. The fallback then rebuilds from these rows in memory and
+        # never re-reads whatever a failed splice may have left on disk.
+        rows = self.load_list()
+        try:
+            with open(self.path, "rb+") as f:
+                f.seek(0, os.SEEK_END)
+                size = f.tell()
+                window = min(size, 64)
+                f.seek(size - window)
+                tail = f.read(window)
+                end = tail.rfind(b"]")
+                # Bail out unless the window shows a last element followed
+                # by the closing bracket
+                before = tail[:end].rstrip() if end >= 0 else b""
+                if end < 0 or not before.endswith(b"}"):
+                    raise ValueError("unexpected file layout")
+
+                # Overwrite from the last '}' onward and only then drop any
+                # leftover bytes: the file never shrinks before the new
+                # tail is in place.
+                f.seek(size - window + len(before))
+                f.write(b"," + encoded + b"]\n")
+                f.flush()
+                f.truncate()
+        except (OSError, ValueError):
+            # Missing or malformed files take the slow path: an atomic
+            # save_list rewrite of the rows captured above.
+            self.save_list(rows + [row])
+            return
+
+        # Keep the parsed-rows cache coherent with the appended file
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            _CACHE.pop(self.path, None)
+        else:
+            _CACHE[self.path] = (
+                stat.st_mtime_ns,
+                stat.st_size,
+                rows + [row],
+            )
+
+    def save_list(
+        self, rows: List[Dict[str, Any]], pretty: bool = _PRETTY
+    ) -> None:
+        """Save a list of dicts.
+
+        Compact output by default: roughly half the bytes to encode,
+        write and re-parse. Set RESV_JSON_PRETTY=1 (or pass pretty=True)
+        to get indented files for manual inspection.
+        """
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        payload = json.dumps(rows, indent=2, ensure_ascii=False)
-        self.path.write_text(payload + "\n", encoding="utf-8")
+        if orjson is not None:
+            option = orjson.OPT_APPEND_NEWLINE
+            if pretty:
+                option |= orjson.OPT_INDENT_2
+            payload = orjson.dumps(rows, option=option)
+        else:
+            if pretty:
+                text = json.dumps(rows, indent=2, ensure_ascii=False)
+            else:
+                text = json.dumps(
+                    rows, separators=(",", ":"), ensure_ascii=False
+                )
+            payload = (text + "\n").encode("utf-8")
+        # Write to a sibling tmp file and swap it in with os.replace so a
+        # crash mid-write never corrupts the only copy of the data. The
+        # atomic rename also guarantees the mtime the cache keys on only
+        # ever reflects a complete file.
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, payload)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp, self.path)
+
+        # Refresh the cache with the rows just written so the next load
+        # skips the reparse entirely.
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            _CACHE.pop(self.path, None)
+        else:
+            _CACHE[self.path] = (stat.st_mtime_ns, stat.st_size, list(rows))
@@ -4,72 +4,148 @@ Unit tests for the Reservation System module.
 
 from __future__ import annotations
 
+import builtins
 import json
+import os
+import shutil
 import unittest
 from pathlib import Path
-from tempfile import TemporaryDirectory
-from unittest.mock import patch
+from tempfile import mkdtemp
 
 from customer import Customer
 from hotel import ConflictError, NotFoundError
 from hotel import Hotel
 from reservation import Reservation
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-class ReservationSystemTests(unittest.TestCase):
-    """Unit test cases for the reservation system."""
 
-    def setUp(self) -> None:
-        """Create a temporary directory and seed JSON files for each test."""
-        # In unittest, this pattern is correct: keep the temp dir for the test
-        # and register cleanup.
-        # pylint: disable=consider-using-with
-        self._tmp_dir = TemporaryDirectory()
-        self.addCleanup(self._tmp_dir.cleanup)
-        self.data_dir = Path(self._tmp_dir.name)
-
-        hotels_path = self.data_dir / "hotels.json"
-        customers_path = self.data_dir / "customers.json"
-        reservations_path = self.data_dir / "reservations.json"
+class _CapturePrint:
+    """Swallow print and record that it ran.
 
-        hotels_path.write_text(
-            json.dumps(
-                [
-                    {
-                        "hotel_id": "H1",
-                        "name": "Hotel One",
-                        "rooms_total": 5,
-                        "rooms_available": 5,
-                    }
-                ],
-                indent=2,
-            )
-            + "\n",
-            encoding="utf-8",
-        )
+    A bare closure is an order of magnitude cheaper than the MagicMock
+    that unittest.mock.patch installs, and these tests only assert that
+    something was printed. call_count is a plain int, so assertions on
+    it are a direct comparison with no descriptor lookup.
+    """
+
+    def __init__(self) -> None:
+        self.call_count = 0
+        self._original = None
+
+    def __enter__(self) -> "_CapturePrint":
+        self._original = builtins.print
+
+        def _stub(*_args, **_kwargs) -> None:
+            self.call_count += 1
+
+        builtins.print = _stub
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        builtins.print = self._original
 
-        customers_path.write_text(
-            json.dumps(
-                [
-                    {
-                        "customer_id": "C1",
-                        "name": "Alice",
-                        "email": "alice@example.com",
-                    }
-                ],
-                indent=2,
-            )
-            + "\n",
-            encoding="utf-8",
-        )
 
-        reservations_path.write_text(
-            "[]\n",
-            encoding="utf-8",
+def _seed(dirpath: Path, files: dict[str, bytes]) -> None:
+    """Write seed files with raw os calls.
+
+    Skips pathlib's per-call Path construction and text-mode machinery:
+    one open/write/close triple per file.
+    """
+    for name, payload in files.items():
+        fd = os.open(
+            os.path.join(dirpath, name),
+            os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+            0o644,
         )
+        try:
+            os.write(fd, payload)
+        finally:
+            os.close(fd)
+
+
+def _dumps(obj) -> bytes:
+    """Compact JSON bytes: the seed files are never read by a human."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+# Back the scratch directories with tmpfs where available: file contents
+# never touch the disk, yet the real os-level stat/write/replace paths in
+# the storage layer are still exercised.
+_MEM_FS_ROOT = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+# Seed payloads encoded once at import; every test writes the same bytes
+_SEED_FILES = {
+    "hotels.json": _dumps(
+        [
+            {
+                "hotel_id": "H1",
+                "name": "Hotel One",
+                "rooms_total": 5,
+                "rooms_available": 5,
+            }
+        ]
+    ),
+    "customers.json": _dumps(
+        [
+            {
+                "customer_id": "C1",
+                "name": "Alice",
+                "email": "alice@example.com",
+            }
+        ]
+    ),
+    "reservations.json": b"[]\n",
+}
+
+# Per-test seed overrides, keyed by test method name. Tests that want a
+# file in a broken state get it seeded that way directly instead of
+# overwriting freshly written valid JSON.
+_SEED_OVERRIDES: dict[str, dict[str, bytes]] = {
+    "test_invalid_json_prints_error_and_continues": {
+        "hotels.json": b"{ invalid json",
+    },
+}
+
+
+class ReservationSystemTests(unittest.TestCase):
+    """Unit test cases for the reservation system."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Set up the class-wide scratch directory."""
+        # One scratch directory for the whole class; rewriting the seed
+        # files in setUp resets state between tests, so per-test
+        # mkdtemp/rmtree churn is unnecessary. Bare mkdtemp skips the
+        # finalizer machinery of TemporaryDirectory; addClassCleanup
+        # already guarantees removal.
+        cls._tmp_path = mkdtemp(dir=_MEM_FS_ROOT)
+        cls.addClassCleanup(shutil.rmtree, cls._tmp_path)
+        cls.data_dir = Path(cls._tmp_path)
+
+    def setUp(self) -> None:
+        """Reset the seed JSON files for each test."""
+        overrides = _SEED_OVERRIDES.get(self._testMethodName)
+        files = _SEED_FILES if overrides is None else _SEED_FILES | overrides
+        _seed(self.data_dir, files)
 
     # No tearDown needed: addCleanup already handles it.
 
+    def _rooms_available(self, hotel_id: str) -> int:
+        """Current room availability for assertions.
+
+        Repeat calls against an unchanged hotels.json are served from the
+        version-keyed load_all cache, so no extra JSON parse happens here.
+        """
+        return Hotel.display_hotel_information(
+            self.data_dir, hotel_id
+        )["rooms_available"]
+
     def test_hotel_crud(self) -> None:
         """Hotel: create, display, modify, and delete."""
         created = Hotel.create_hotel(self.data_dir, "H2", "Hotel Two", 3)
@@ -115,9 +191,7 @@ class ReservationSystemTests(unittest.TestCase):
 
     def test_reservation_create_and_cancel_updates_inventory(self) -> None:
         """Reservation: create/cancel/ restore availability."""
-        before = Hotel.display_hotel_information(
-            self.data_dir, "H1"
-        )["rooms_available"]
+        before = self._rooms_available("H1")
 
         res = Reservation.create_a_reservation(
             self.data_dir,
@@ -128,17 +202,13 @@ class ReservationSystemTests(unittest.TestCase):
         )
         self.assertEqual(res.status, "ACTIVE")
 
-        mid = Hotel.display_hotel_information(
-            self.data_dir, "H1"
-        )["rooms_available"]
+        mid = self._rooms_available("H1")
         self.assertEqual(mid, before - 2)
 
         cancelled = Reservation.cancel_a_reservation(self.data_dir, "R1")
         self.assertEqual(cancelled.status, "CANCELLED")
 
-        after = Hotel.display_hotel_information(
-            self.data_dir, "H1"
-        )["rooms_available"]
+        after = self._rooms_available("H1")
         self.assertEqual(after, before)
 
     def test_conflict_and_not_found_paths(self) -> None:
@@ -185,6 +255,52 @@ class ReservationSystemTests(unittest.TestCase):
         with self.assertRaises(ConflictError):
             Reservation.cancel_a_reservation(self.data_dir, "R3")
 
+    def test_reservation_create_many_batch(self) -> None:
+        """Batch create persists every row; conflicts abort unwritten."""
+        before = self._rooms_available("H1")
+
+        created = Reservation.create_many(
+            self.data_dir,
+            [
+                {
+                    "reservation_id": "R20",
+                    "customer_id": "C1",
+                    "hotel_id": "H1",
+                    "room_count": 2,
+                },
+                {
+                    "reservation_id": "R21",
+                    "customer_id": "C1",
+                    "hotel_id": "H1",
+                },
+            ],
+        )
+        self.assertEqual(
+            [r.reservation_id for r in created], ["R20", "R21"]
+        )
+        self.assertEqual(self._rooms_available("H1"), before - 3)
+
+        stored = Reservation.load_index(self.data_dir)
+        self.assertEqual(stored["R20"].room_count, 2)
+        self.assertEqual(stored["R21"].status, "ACTIVE")
+
+        with self.assertRaises(ConflictError):
+            Reservation.create_many(
+                self.data_dir,
+                [
+                    {
+                        "reservation_id": "R20",
+                        "customer_id": "C1",
+                        "hotel_id": "H1",
+                        "room_count": 1,
+                    },
+                ],
+            )
+
+        # The failed batch must not have touched either file
+        self.assertEqual(self._rooms_available("H1"), before - 3)
+        self.assertEqual(len(Reservation.load_all(self.data_dir)), 2)
+
     def test_prevent_delete_if_active_reservation(self) -> None:
         """Cannot delete hotel/customer when an active reservation exists."""
         _ = Reservation.create_a_reservation(
@@ -203,23 +319,19 @@ class ReservationSystemTests(unittest.TestCase):
 
     def test_invalid_json_prints_error_and_continues(self) -> None:
         """Invalid JSON should print an error and continue (no crash)."""
-        hotels_path = self.data_dir / "hotels.json"
-        hotels_path.write_text(
-            "{ invalid json",
-            encoding="utf-8",
-        )
-
-        with patch("builtins.print") as mocked_print:
+        # setUp already seeded hotels.json in its broken state via
+        # _SEED_OVERRIDES; no valid payload was written first.
+        with _CapturePrint() as cap:
             hotels = Hotel.load_all(self.data_dir)
 
         self.assertEqual(hotels, [])
-        self.assertTrue(mocked_print.called)
+        self.assertGreater(cap.call_count, 0)
 
     def test_invalid_rows_are_skipped(self) -> None:
         """Invalid rows should be skipped while valid ones are loaded."""
         customers_path = self.data_dir / "customers.json"
-        customers_path.write_text(
-            json.dumps(
+        customers_path.write_bytes(
+            _dumps(
                 [
                     {
                         "customer_id": "C_OK",
@@ -231,20 +343,17 @@ class ReservationSystemTests(unittest.TestCase):
                         "name": "Bad",
                         "email": "not-an-email",
                     },
-                ],
-                indent=2,
+                ]
             )
-            + "\n",
-            encoding="utf-8",
         )
 
-        with patch("builtins.print") as mocked_print:
+        with _CapturePrint() as cap:
             customers = Customer.load_all(self.data_dir)
 
         ids = {c.customer_id for c in customers}
         self.assertIn("C_OK", ids)
         self.assertNotIn("C_BAD", ids)
-        self.assertTrue(mocked_print.called)
+        self.assertGreater(cap.call_count, 0)
 
 
 if __name__ == "__main__":